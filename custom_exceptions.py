@@ -123,3 +123,52 @@ class InvalidSaveDataError(GameError):
     """Raised when save file contains invalid data"""
     pass
 
+
+# ============================================================================
+# EXCEPTION GROUPS
+# ============================================================================
+
+# Every specific exception in a category, for catching them together:
+#     except ALL_INVENTORY_ERRORS as e:
+ALL_INVENTORY_ERRORS = (
+    InventoryFullError,
+    ItemNotFoundError,
+    InsufficientResourcesError,
+    InvalidItemTypeError
+)
+ALL_QUEST_ERRORS = (
+    QuestNotFoundError,
+    QuestRequirementsNotMetError,
+    QuestAlreadyCompletedError,
+    QuestNotActiveError
+)
+
+# ============================================================================
+# HIERARCHY CHECK
+# ============================================================================
+
+def _check_hierarchy(base=GameError):
+    """
+    Verify every game exception has exactly one base class and uses the
+    default metaclass
+
+    Keeps the tree single-inheritance so each exception has one category
+    (DataError, CharacterError, ...) to catch it by, and keeps isinstance()
+    and except matching on CPython's built-in type check rather than a
+    custom __instancecheck__.
+    Raises: TypeError if a class has multiple bases or a custom metaclass
+    """
+    if type(base) is not type:
+        raise TypeError(f"{base.__name__} must not use a custom metaclass")
+    for cls in base.__subclasses__():
+        if len(cls.__bases__) != 1:
+            raise TypeError(f"{cls.__name__} must have exactly one base class")
+        _check_hierarchy(cls)
+
+_check_hierarchy()
+
+for _base, _group in ((InventoryError, ALL_INVENTORY_ERRORS),
+                      (QuestError, ALL_QUEST_ERRORS)):
+    if set(_group) != set(_base.__subclasses__()):
+        raise TypeError(f"exception group for {_base.__name__} is out of date")
+del _base, _group
@@ -16,6 +16,16 @@ from custom_exceptions import (
     CorruptedDataError
 )
 
+# Required fields for each data record
+REQUIRED_QUEST_KEYS = frozenset({
+    'quest_id', 'title', 'description', 'reward_xp',
+    'reward_gold', 'required_level', 'prerequisite'
+})
+REQUIRED_ITEM_KEYS = frozenset({
+    'item_id', 'name', 'type', 'effect', 'cost', 'description'
+})
+VALID_ITEM_TYPES = frozenset({'weapon', 'armor', 'consumable'})
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
@@ -55,6 +65,9 @@ def load_items(filename="data/items.txt"):
     COST: 100
     DESCRIPTION: Item description
     
+    The EFFECT line is parsed once here (see parse_item_effect), so each
+    item's 'effect' is a (stat_name, value) tuple, e.g. ('health', 20)
+    
     Returns: Dictionary of items {item_id: item_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
@@ -74,6 +87,7 @@ def validate_quest_data(quest_dict):
     """
     # TODO: Implement validation
     # Check that all required keys exist
+    #   (REQUIRED_QUEST_KEYS.issubset(quest_dict) checks them all at once)
     # Check that numeric values are actually numbers
     pass
 
@@ -88,6 +102,8 @@ def validate_item_data(item_dict):
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
     # TODO: Implement validation
+    # Check that all required keys exist (see REQUIRED_ITEM_KEYS)
+    # Check that type is in VALID_ITEM_TYPES
     pass
 
 def create_default_data_files():
@@ -132,6 +148,25 @@ def parse_item_block(lines):
     Raises: InvalidDataFormatError if parsing fails
     """
     # TODO: Implement parsing logic
+    # Convert EFFECT with parse_item_effect() into a (stat_name, value) tuple
+    # Convert COST to an integer
+    pass
+
+def parse_item_effect(effect_string):
+    """
+    Parse item effect string into stat name and value
+    
+    Called by parse_item_block so loaded items store the parsed tuple
+    
+    Args:
+        effect_string: String in format "stat_name:value"
+    
+    Returns: Tuple of (stat_name, value)
+    Example: "health:20" → ("health", 20)
+    """
+    # TODO: Implement effect parsing
+    # Split on ":"
+    # Convert value to integer
     pass
 
 # ============================================================================
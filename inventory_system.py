@@ -107,6 +107,8 @@ def use_item(character, item_id, item_data):
         item_id: Item to use
         item_data: Item information dictionary from game_data
     
+    item_data['effect'] is a (stat_name, value) tuple, e.g. ('health', 20)
+    
     Item types and effects:
     - consumable: Apply effect and remove from inventory
     - weapon/armor: Cannot be "used", only equipped
@@ -119,7 +121,7 @@ def use_item(character, item_id, item_data):
     # TODO: Implement item usage
     # Check if character has the item
     # Check if item type is 'consumable'
-    # Parse effect (format: "stat_name:value" e.g., "health:20")
+    # Unpack effect: stat_name, value = item_data['effect']
     # Apply effect to character
     # Remove item from inventory
     pass
@@ -133,7 +135,7 @@ def equip_weapon(character, item_id, item_data):
         item_id: Weapon to equip
         item_data: Item information dictionary
     
-    Weapon effect format: "strength:5" (adds 5 to strength)
+    Weapon effect format: ('strength', 5) (adds 5 to strength)
     
     If character already has weapon equipped:
     - Unequip current weapon (remove bonus)
@@ -147,7 +149,7 @@ def equip_weapon(character, item_id, item_data):
     # TODO: Implement weapon equipping
     # Check item exists and is type 'weapon'
     # Handle unequipping current weapon if exists
-    # Parse effect and apply to character stats
+    # Unpack effect and apply to character stats
     # Store equipped_weapon in character dictionary
     # Remove item from inventory
     pass
@@ -161,7 +163,7 @@ def equip_armor(character, item_id, item_data):
         item_id: Armor to equip
         item_data: Item information dictionary
     
-    Armor effect format: "max_health:10" (adds 10 to max_health)
+    Armor effect format: ('max_health', 10) (adds 10 to max_health)
     
     If character already has armor equipped:
     - Unequip current armor (remove bonus)
@@ -248,21 +250,6 @@ def sell_item(character, item_id, item_data):
 # HELPER FUNCTIONS
 # ============================================================================
 
-def parse_item_effect(effect_string):
-    """
-    Parse item effect string into stat name and value
-    
-    Args:
-        effect_string: String in format "stat_name:value"
-    
-    Returns: Tuple of (stat_name, value)
-    Example: "health:20" → ("health", 20)
-    """
-    # TODO: Implement effect parsing
-    # Split on ":"
-    # Convert value to integer
-    pass
-
 def apply_stat_effect(character, stat_name, value):
     """
     Apply a stat modification to character
@@ -311,7 +298,7 @@ if __name__ == "__main__":
     # test_item = {
     #     'item_id': 'health_potion',
     #     'type': 'consumable',
-    #     'effect': 'health:20'
+    #     'effect': ('health', 20)
     # }
     # 
     # try:
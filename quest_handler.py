@@ -30,25 +30,26 @@ def accept_quest(character, quest_id, quest_data_dict):
         quest_id: Quest to accept
         quest_data_dict: Dictionary of all quest data
     
-    Requirements to accept quest:
-    - Character level >= quest required_level
-    - Prerequisite quest completed (if any)
+    Requirements to accept quest (checked in this order):
     - Quest not already completed
     - Quest not already active
+    - Character level >= quest required_level
+    - Prerequisite quest completed (if any)
     
     Returns: True if quest accepted
     Raises:
         QuestNotFoundError if quest_id not in quest_data_dict
+        QuestAlreadyCompletedError if quest already done
         InsufficientLevelError if character level too low
         QuestRequirementsNotMetError if prerequisite not completed
-        QuestAlreadyCompletedError if quest already done
     """
     # TODO: Implement quest acceptance
-    # Check quest exists
-    # Check level requirement
-    # Check prerequisite (if not "NONE")
+    # Look up the quest once with quest_data_dict.get(quest_id)
+    #   (None means the quest doesn't exist)
     # Check not already completed
     # Check not already active
+    # Check level requirement
+    # Check prerequisite (if not "NONE")
     # Add to character['active_quests']
     pass
 
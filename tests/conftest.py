@@ -0,0 +1,26 @@
+"""
+Shared pytest configuration
+Makes the project modules importable and provides shared fixtures
+"""
+
+import pytest
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# ============================================================================
+# SHARED FIXTURES
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def goblin_template():
+    """
+    Goblin created once per test session
+
+    Tests must take copy.deepcopy(goblin_template) before using it.
+    """
+    import combat_system
+    
+    return combat_system.create_enemy("goblin")
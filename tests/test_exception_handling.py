@@ -7,13 +7,27 @@ import pytest
 import sys
 import os
 
+# Add parent directory to path (also needed when run directly as a script)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from custom_exceptions import *
-import character_manager
-import inventory_system
-import quest_handler
-import game_data
+from custom_exceptions import (
+    InvalidCharacterClassError,
+    CharacterNotFoundError,
+    CharacterDeadError,
+    InventoryFullError,
+    ItemNotFoundError,
+    InsufficientResourcesError,
+    InvalidItemTypeError,
+    QuestNotFoundError,
+    InsufficientLevelError,
+    QuestRequirementsNotMetError,
+    QuestAlreadyCompletedError,
+    QuestNotActiveError,
+    MissingDataFileError,
+    InvalidDataFormatError,
+    InvalidTargetError,
+    CombatNotActiveError
+)
 
 # ============================================================================
 # CHARACTER MANAGER EXCEPTION TESTS
@@ -21,16 +35,22 @@ import game_data
 
 def test_invalid_character_class_exception():
     """Test that InvalidCharacterClassError is raised for invalid class"""
+    import character_manager
+    
     with pytest.raises(InvalidCharacterClassError):
         character_manager.create_character("Test", "InvalidClass")
 
 def test_character_not_found_exception():
     """Test that CharacterNotFoundError is raised for missing character"""
+    import character_manager
+    
     with pytest.raises(CharacterNotFoundError):
         character_manager.load_character("NonexistentCharacter")
 
 def test_character_dead_exception():
     """Test that CharacterDeadError is raised when appropriate"""
+    import character_manager
+    
     char = character_manager.create_character("Test", "Warrior")
     char['health'] = 0
     
@@ -43,6 +63,8 @@ def test_character_dead_exception():
 
 def test_inventory_full_exception():
     """Test that InventoryFullError is raised when inventory is full"""
+    import inventory_system
+    
     char = {'inventory': ['item'] * inventory_system.MAX_INVENTORY_SIZE, 'gold': 100}
     
     with pytest.raises(InventoryFullError):
@@ -50,6 +72,8 @@ def test_inventory_full_exception():
 
 def test_item_not_found_exception():
     """Test that ItemNotFoundError is raised for missing items"""
+    import inventory_system
+    
     char = {'inventory': [], 'gold': 100}
     
     with pytest.raises(ItemNotFoundError):
@@ -57,6 +81,8 @@ def test_item_not_found_exception():
 
 def test_insufficient_resources_exception():
     """Test that InsufficientResourcesError is raised when not enough gold"""
+    import inventory_system
+    
     char = {'inventory': [], 'gold': 10}
     item_data = {'cost': 100}
     
@@ -65,8 +91,10 @@ def test_insufficient_resources_exception():
 
 def test_invalid_item_type_exception():
     """Test that InvalidItemTypeError is raised for wrong item types"""
+    import inventory_system
+    
     char = {'inventory': ['weapon1'], 'health': 80, 'max_health': 100}
-    item_data = {'type': 'weapon', 'effect': 'strength:5'}
+    item_data = {'type': 'weapon', 'effect': ('strength', 5)}
     
     # Trying to "use" a weapon should raise exception
     with pytest.raises(InvalidItemTypeError):
@@ -76,58 +104,42 @@ def test_invalid_item_type_exception():
 # QUEST HANDLER EXCEPTION TESTS
 # ============================================================================
 
-def test_quest_not_found_exception():
-    """Test that QuestNotFoundError is raised for invalid quests"""
-    char = {'level': 5, 'active_quests': [], 'completed_quests': []}
-    quests = {}
+@pytest.mark.parametrize("exc_cls, char, quest_id, quests", [
+    # Quest does not exist
+    (QuestNotFoundError,
+     {'level': 5, 'active_quests': [], 'completed_quests': []},
+     "fake_quest", {}),
+    # Level requirement not met
+    (InsufficientLevelError,
+     {'level': 1, 'active_quests': [], 'completed_quests': []},
+     "hard_quest",
+     {'hard_quest': {'quest_id': 'hard_quest', 'required_level': 10,
+                     'prerequisite': 'NONE'}}),
+    # Prerequisite not completed
+    (QuestRequirementsNotMetError,
+     {'level': 10, 'active_quests': [], 'completed_quests': []},
+     "second_quest",
+     {'second_quest': {'quest_id': 'second_quest', 'required_level': 1,
+                       'prerequisite': 'first_quest'}}),
+    # Quest already completed
+    (QuestAlreadyCompletedError,
+     {'level': 5, 'active_quests': [], 'completed_quests': ['done_quest']},
+     "done_quest",
+     {'done_quest': {'quest_id': 'done_quest', 'required_level': 1,
+                     'prerequisite': 'NONE'}}),
+], ids=["quest_not_found", "insufficient_level",
+        "requirements_not_met", "already_completed"])
+def test_accept_quest_exceptions(exc_cls, char, quest_id, quests):
+    """Test that accept_quest raises the right error for each failed requirement"""
+    import quest_handler
     
-    with pytest.raises(QuestNotFoundError):
-        quest_handler.accept_quest(char, "fake_quest", quests)
-
-def test_insufficient_level_exception():
-    """Test that InsufficientLevelError is raised for level requirements"""
-    char = {'level': 1, 'active_quests': [], 'completed_quests': []}
-    quests = {
-        'hard_quest': {
-            'quest_id': 'hard_quest',
-            'required_level': 10,
-            'prerequisite': 'NONE'
-        }
-    }
-    
-    with pytest.raises(InsufficientLevelError):
-        quest_handler.accept_quest(char, "hard_quest", quests)
-
-def test_quest_requirements_not_met_exception():
-    """Test that QuestRequirementsNotMetError is raised for prerequisites"""
-    char = {'level': 10, 'active_quests': [], 'completed_quests': []}
-    quests = {
-        'second_quest': {
-            'quest_id': 'second_quest',
-            'required_level': 1,
-            'prerequisite': 'first_quest'
-        }
-    }
-    
-    with pytest.raises(QuestRequirementsNotMetError):
-        quest_handler.accept_quest(char, "second_quest", quests)
-
-def test_quest_already_completed_exception():
-    """Test that QuestAlreadyCompletedError is raised for completed quests"""
-    char = {'level': 5, 'active_quests': [], 'completed_quests': ['done_quest']}
-    quests = {
-        'done_quest': {
-            'quest_id': 'done_quest',
-            'required_level': 1,
-            'prerequisite': 'NONE'
-        }
-    }
-    
-    with pytest.raises(QuestAlreadyCompletedError):
-        quest_handler.accept_quest(char, "done_quest", quests)
+    with pytest.raises(exc_cls):
+        quest_handler.accept_quest(char, quest_id, quests)
 
 def test_quest_not_active_exception():
     """Test that QuestNotActiveError is raised when completing inactive quest"""
+    import quest_handler
+    
     char = {'level': 5, 'active_quests': [], 'completed_quests': []}
     quests = {
         'test_quest': {
@@ -145,20 +157,21 @@ def test_quest_not_active_exception():
 
 def test_missing_data_file_exception():
     """Test that MissingDataFileError is raised for missing files"""
+    import game_data
+    
     with pytest.raises(MissingDataFileError):
         game_data.load_quests("nonexistent_file.txt")
 
-def test_invalid_data_format_exception():
+def test_invalid_data_format_exception(tmp_path):
     """Test that InvalidDataFormatError is raised for bad data"""
-    # Create a temporary file with invalid format
-    with open("test_bad_data.txt", "w") as f:
-        f.write("This is not valid quest data")
-    
-    try:
-        with pytest.raises(InvalidDataFormatError):
-            game_data.load_quests("test_bad_data.txt")
-    finally:
-        os.remove("test_bad_data.txt")
+    import game_data
+    
+    # Create a temporary file with invalid format (pytest removes tmp_path)
+    bad_file = tmp_path / "test_bad_data.txt"
+    bad_file.write_text("This is not valid quest data")
+    
+    with pytest.raises(InvalidDataFormatError):
+        game_data.load_quests(str(bad_file))
 
 # ============================================================================
 # COMBAT EXCEPTION TESTS
@@ -4,9 +4,11 @@ Tests that modules work together correctly
 """
 
 import pytest
+import copy
 import sys
 import os
 
+# Add parent directory to path (also needed when run directly as a script)
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import character_manager
@@ -15,6 +17,28 @@ import quest_handler
 import combat_system
 import game_data
 
+# ============================================================================
+# FIXTURES
+# ============================================================================
+
+@pytest.fixture
+def warrior_template():
+    """Level 1 Warrior character dict with create_character's documented stats"""
+    return {
+        'name': 'T',
+        'class': 'Warrior',
+        'level': 1,
+        'health': 120,
+        'max_health': 120,
+        'strength': 15,
+        'magic': 5,
+        'gold': 100,
+        'experience': 0,
+        'inventory': [],
+        'active_quests': [],
+        'completed_quests': []
+    }
+
 # ============================================================================
 # CHARACTER INTEGRATION TESTS
 # ============================================================================
@@ -73,30 +97,30 @@ def test_character_gold_management():
 # INVENTORY INTEGRATION TESTS
 # ============================================================================
 
-def test_inventory_item_management():
+def test_inventory_item_management(warrior_template):
     """Test adding, using, and removing items"""
-    char = character_manager.create_character("InventoryTest", "Cleric")
+    char = warrior_template
     
     # Add items
     inventory_system.add_item_to_inventory(char, "health_potion")
     assert "health_potion" in char['inventory']
     
     # Use consumable
-    item_data = {'type': 'consumable', 'effect': 'health:20'}
+    item_data = {'type': 'consumable', 'effect': ('health', 20)}
     char['health'] = 50
     result = inventory_system.use_item(char, "health_potion", item_data)
     
     assert "health_potion" not in char['inventory']  # Consumed
     assert char['health'] == 70  # Healed
 
-def test_equipment_system():
+def test_equipment_system(warrior_template):
     """Test equipping weapons and armor"""
-    char = character_manager.create_character("EquipTest", "Warrior")
+    char = warrior_template
     original_strength = char['strength']
     
     # Add and equip weapon
     inventory_system.add_item_to_inventory(char, "iron_sword")
-    weapon_data = {'type': 'weapon', 'effect': 'strength:5'}
+    weapon_data = {'type': 'weapon', 'effect': ('strength', 5)}
     
     inventory_system.equip_weapon(char, "iron_sword", weapon_data)
     
@@ -104,9 +128,9 @@ def test_equipment_system():
     assert 'equipped_weapon' in char
     assert char['equipped_weapon'] == "iron_sword"
 
-def test_shop_system():
+def test_shop_system(warrior_template):
     """Test buying and selling items"""
-    char = character_manager.create_character("ShopTest", "Mage")
+    char = warrior_template
     original_gold = char['gold']
     
     item_data = {'cost': 25, 'type': 'consumable'}
@@ -191,10 +215,10 @@ def test_quest_prerequisite_system():
 # COMBAT INTEGRATION TESTS
 # ============================================================================
 
-def test_combat_system_basic_battle():
+def test_combat_system_basic_battle(goblin_template):
     """Test basic combat functionality"""
     char = character_manager.create_character("CombatTest", "Warrior")
-    enemy = combat_system.create_enemy("goblin")
+    enemy = copy.deepcopy(goblin_template)
     
     assert enemy['name'] == "Goblin"
     assert enemy['health'] > 0
@@ -204,13 +228,13 @@ def test_combat_system_basic_battle():
     assert battle.character == char
     assert battle.enemy == enemy
 
-def test_combat_victory_rewards():
+def test_combat_victory_rewards(goblin_template):
     """Test that winning combat grants rewards"""
     char = character_manager.create_character("RewardTest", "Mage")
     original_xp = char['experience']
     original_gold = char['gold']
     
-    enemy = combat_system.create_enemy("goblin")
+    enemy = copy.deepcopy(goblin_template)
     expected_xp = enemy['xp_reward']
     expected_gold = enemy['gold_reward']
     
@@ -267,7 +291,7 @@ def test_data_validation():
         'item_id': 'test',
         'name': 'Test',
         'type': 'consumable',
-        'effect': 'health:20',
+        'effect': ('health', 20),
         'cost': 25,
         'description': 'Test'
     }
@@ -278,7 +302,7 @@ def test_data_validation():
 # FULL GAME WORKFLOW TEST
 # ============================================================================
 
-def test_complete_game_workflow():
+def test_complete_game_workflow(goblin_template):
     """Test a complete game workflow from start to victory"""
     # Create character
     char = character_manager.create_character("WorkflowTest", "Warrior")
@@ -291,7 +315,7 @@ def test_complete_game_workflow():
     quest_handler.accept_quest(char, 'first_steps', quests)
     
     # Fight an enemy
-    enemy = combat_system.create_enemy("goblin")
+    enemy = copy.deepcopy(goblin_template)
     battle = combat_system.SimpleBattle(char, enemy)
     
     # Simulate victory (just kill enemy for testing)
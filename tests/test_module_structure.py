@@ -4,12 +4,8 @@ Tests that all required modules exist and have proper functions
 """
 
 import pytest
-import sys
 import os
 
-# Add parent directory to path
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 def test_custom_exceptions_module_exists():
     """Test that custom_exceptions module can be imported"""
     import custom_exceptions
@@ -55,10 +51,10 @@ def test_custom_exceptions_defined():
         QuestNotFoundError, InventoryFullError
     )
     
-    # Test inheritance
-    assert issubclass(DataError, GameError)
-    assert issubclass(InvalidDataFormatError, DataError)
-    assert issubclass(CharacterNotFoundError, CharacterError)
+    # Test inheritance (each class has exactly one, direct parent)
+    assert DataError.__bases__ == (GameError,)
+    assert InvalidDataFormatError.__bases__ == (DataError,)
+    assert CharacterNotFoundError.__bases__ == (CharacterError,)
 
 # Test game_data functions exist
 def test_game_data_functions_exist():